@@ -5,6 +5,7 @@ Complete CRUD for menu categories and items with venue isolation and advanced fe
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, status, Depends, UploadFile, File, Query
+from pydantic import TypeAdapter
 
 from app.models.schemas import MenuCategory, MenuItem, SpiceLevel
 from app.models.dto import (
@@ -23,6 +24,10 @@ from app.utils.menu_item_utils import ensure_menu_item_fields, process_menu_item
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Validate whole response lists in one call instead of one model per row
+_menu_item_list_adapter = TypeAdapter(List[MenuItemResponseDTO])
+_menu_category_list_adapter = TypeAdapter(List[MenuCategoryResponseDTO])
+
 
 class MenuCategoriesEndpoint(WorkspaceIsolatedEndpoint[MenuCategory, MenuCategoryCreateDTO, MenuCategoryUpdateDTO]):
     """Enhanced Menu Categories endpoint with venue isolation"""
@@ -4414,7 +4419,7 @@ async def get_venue_categories(
         if current_user.get('role') != 'admin':
             categories_data = [cat for cat in categories_data if cat.get('is_active', False)]
         
-        categories = [MenuCategoryResponseDTO(**cat) for cat in categories_data]
+        categories = _menu_category_list_adapter.validate_python(categories_data)
         
         logger.info(f"Retrieved {len(categories)} categories for venue: {venue_id}")
         return categories
@@ -4553,7 +4558,7 @@ async def get_venue_menu_items(
             # Process items to ensure all required fields are present
             processed_items = process_menu_items_for_response(items_data)
             
-            items = [MenuItemResponseDTO(**item) for item in processed_items]
+            items = _menu_item_list_adapter.validate_python(processed_items)
         
         logger.info(f"Retrieved {len(items)} menu items for venue: {venue_id}")
         return items
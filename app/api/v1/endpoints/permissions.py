@@ -52,6 +52,13 @@ class PermissionRepository:
             return doc.to_dict()
         return None
     
+    async def get_by_ids(self, permission_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get several permissions in one batched read, skipping missing IDs"""
+        if not permission_ids:
+            return []
+        refs = [self.db.collection(self.collection).document(pid) for pid in permission_ids]
+        return [doc.to_dict() for doc in self.db.get_all(refs) if doc.exists]
+    
     async def get_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Get permission by name"""
         query = self.db.collection(self.collection).where("name", "==", name)
@@ -1107,20 +1114,46 @@ async def check_user_permissions(
         
         logger.info(f"User {current_user['id']} checking permissions for user {user_id}")
         
-        # Get user permissions (this returns ApiResponse now)
-        user_perms_response = await get_user_permissions(user_id, current_user)
-        user_permissions_data = user_perms_response.data
-        user_permission_names = [perm['name'] for perm in user_permissions_data.get('permissions', [])]
+        from app.database.firestore import get_user_repo
+        user = await get_user_repo().get_by_id(user_id)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+        
+        # Resolve the role's permission names with one batched read instead of
+        # building full permission DTOs (and per-permission role lookups)
+        role = None
+        user_permission_names = set()
+        user_role_id = user.get('role_id')
+        if user_role_id:
+            role_doc = get_firestore_client().collection("roles").document(user_role_id).get()
+            if role_doc.exists:
+                role_data = role_doc.to_dict()
+                role = {
+                    "id": user_role_id,
+                    "name": role_data.get('name', 'Unknown'),
+                    "display_name": role_data.get('display_name', role_data.get('name', 'Unknown')),
+                    "description": role_data.get('description', ''),
+                    "exists": True
+                }
+                permissions = await perm_repo.get_by_ids(role_data.get('permission_ids', []))
+                user_permission_names = {perm.get('name') for perm in permissions}
+            else:
+                logger.warning(f"User {user_id} has invalid role_id: {user_role_id}")
+                role = {"id": user_role_id, "name": "Invalid Role", "exists": False}
         
         # Check each requested permission
-        permission_check = {}
-        for perm_name in permission_names:
-            permission_check[perm_name] = perm_name in user_permission_names
+        permission_check = {
+            perm_name: perm_name in user_permission_names
+            for perm_name in permission_names
+        }
         
         response_data = {
             "user_id": user_id,
-            "user_name": user_permissions_data.get('user_name'),
-            "role": user_permissions_data.get('role'),
+            "user_name": f"{user.get('first_name', '')} {user.get('last_name', '')}".strip(),
+            "role": role,
             "requested_permissions": permission_names,
             "permission_results": permission_check,
             "has_all_permissions": all(permission_check.values()),
@@ -954,17 +954,21 @@ async def fix_venue_status_data(
         repo = get_venue_repo()
         all_venues = await repo.get_all()
         
-        fixed_count = 0
+        updates = []
         for venue in all_venues:
             original_status = venue.get('status')
             cleaned_venue = clean_venue_status(venue.copy())
             new_status = cleaned_venue.get('status')
             
-            # If status was changed, update the venue
+            # If status was changed, queue the venue for update
             if original_status != new_status:
-                await repo.update(venue['id'], {'status': new_status})
-                fixed_count += 1
-                logger.info(f"Fixed venue {venue['id']} status from {repr(original_status)} to {repr(new_status)}")
+                updates.append((venue['id'], {'status': new_status}))
+                logger.info(f"Fixing venue {venue['id']} status from {repr(original_status)} to {repr(new_status)}")
+        
+        # Write all fixes in batched commits rather than one round trip per venue
+        if updates:
+            await repo.update_batch(updates)
+        fixed_count = len(updates)
         
         logger.info(f"Venue status data maintenance completed. Fixed {fixed_count} venues.")
         
@@ -20,6 +20,8 @@ from google.oauth2 import service_account
 
 import logging
 
+from functools import lru_cache
+
 
 
 logger = logging.getLogger(__name__)
@@ -438,9 +440,11 @@ class CloudServiceManager:
 
 # =============================================================================
 
+@lru_cache(maxsize=1)
+
 def get_settings() -> Settings:
 
-  """Get application settings"""
+  """Get application settings (parsed once and cached)"""
 
   return Settings()
 
@@ -365,7 +365,7 @@ def log_function_call(include_args: bool = False, include_result: bool = False):
                 log_data["args"] = str(args)
                 log_data["kwargs"] = str(kwargs)
             
-            logger.debug(f"Entering function: {func.__name__}", extra=log_data)
+            logger.debug("Entering function: %s", func.__name__, extra=log_data)
             
             try:
                 result = await func(*args, **kwargs)
@@ -420,7 +420,7 @@ def log_function_call(include_args: bool = False, include_result: bool = False):
                 log_data["args"] = str(args)
                 log_data["kwargs"] = str(kwargs)
             
-            logger.debug(f"Entering function: {func.__name__}", extra=log_data)
+            logger.debug("Entering function: %s", func.__name__, extra=log_data)
             
             try:
                 result = func(*args, **kwargs)
@@ -15,6 +15,9 @@ import time
 
 logger = logging.getLogger(__name__)
 
+# Firestore rejects write batches with more than 500 operations
+MAX_BATCH_OPERATIONS = 500
+
 
 class FirestoreRepository(EnhancedLoggerMixin):
     """Base repository class for Firestore operations"""
@@ -89,8 +92,9 @@ class FirestoreRepository(EnhancedLoggerMixin):
             data = self._prepare_data_for_firestore(data)
             
             # Add timestamps (timezone-aware)
-            data['created_at'] = datetime.now(timezone.utc)
-            data['updated_at'] = datetime.now(timezone.utc)
+            now = datetime.now(timezone.utc)
+            data['created_at'] = now
+            data['updated_at'] = now
             
             if doc_id:
                 # Ensure the id field matches the document ID
@@ -385,23 +389,32 @@ class FirestoreRepository(EnhancedLoggerMixin):
             raise
     
     async def update_batch(self, updates: List[tuple]) -> bool:
-        """Batch update multiple documents"""
+        """Batch update multiple documents, committing every MAX_BATCH_OPERATIONS writes"""
         self._ensure_collection()
         
         try:
             # Firestore batch operations
             batch = self.db.batch()
+            batch_operations = 0
+            now = datetime.now(timezone.utc)
             
             for doc_id, update_data in updates:
                 # Prepare data for Firestore
                 update_data = self._prepare_data_for_firestore(update_data)
-                update_data['updated_at'] = datetime.now(timezone.utc)
+                update_data['updated_at'] = now
                 
                 doc_ref = self.collection.document(doc_id)
                 batch.update(doc_ref, update_data)
+                batch_operations += 1
+                
+                if batch_operations >= MAX_BATCH_OPERATIONS:
+                    batch.commit()
+                    batch = self.db.batch()
+                    batch_operations = 0
             
-            # Commit batch
-            batch.commit()
+            # Commit remaining operations
+            if batch_operations > 0:
+                batch.commit()
             
             self.log_operation("batch_update", 
                              collection=self.collection_name, 
@@ -415,27 +428,41 @@ class FirestoreRepository(EnhancedLoggerMixin):
             raise
     
     async def create_batch(self, items_data: List[Dict[str, Any]]) -> List[str]:
-        """Batch create multiple documents"""
+        """
+        Batch create multiple documents.
+        Items carrying an 'id' are written under that document ID; the rest get
+        auto-generated IDs. Commits every MAX_BATCH_OPERATIONS writes.
+        """
         self._ensure_collection()
         
         try:
             # Firestore batch operations
             batch = self.db.batch()
+            batch_operations = 0
             created_ids = []
+            now = datetime.now(timezone.utc)
             
             for data in items_data:
                 # Prepare data for Firestore
                 data = self._prepare_data_for_firestore(data)
-                data['created_at'] = datetime.now(timezone.utc)
-                data['updated_at'] = datetime.now(timezone.utc)
+                data['created_at'] = now
+                data['updated_at'] = now
                 
-                doc_ref = self.collection.document()
+                doc_id = data.get('id')
+                doc_ref = self.collection.document(doc_id) if doc_id else self.collection.document()
                 data['id'] = doc_ref.id
                 batch.set(doc_ref, data)
                 created_ids.append(doc_ref.id)
+                batch_operations += 1
+                
+                if batch_operations >= MAX_BATCH_OPERATIONS:
+                    batch.commit()
+                    batch = self.db.batch()
+                    batch_operations = 0
             
-            # Commit batch
-            batch.commit()
+            # Commit remaining operations
+            if batch_operations > 0:
+                batch.commit()
             
             self.log_operation("batch_create", 
                              collection=self.collection_name, 
@@ -456,37 +483,10 @@ class FirestoreRepository(EnhancedLoggerMixin):
         self._ensure_collection()
         
         try:
-            docs = self.collection.stream()
-            checked_count = 0
-            fixed_count = 0
-            
-            batch = self.db.batch()
-            batch_operations = 0
-            
-            for doc in docs:
-                checked_count += 1
-                data = doc.to_dict()
-                
-                # Check if id field is missing or doesn't match document ID
-                if 'id' not in data or data['id'] != doc.id:
-                    data['id'] = doc.id
-                    data['updated_at'] = datetime.now(timezone.utc)
-                    
-                    doc_ref = self.collection.document(doc.id)
-                    batch.update(doc_ref, {'id': doc.id, 'updated_at': datetime.now(timezone.utc)})
-                    
-                    fixed_count += 1
-                    batch_operations += 1
-                    
-                    # Commit batch every 500 operations (Firestore limit)
-                    if batch_operations >= 500:
-                        batch.commit()
-                        batch = self.db.batch()
-                        batch_operations = 0
-            
-            # Commit remaining operations
-            if batch_operations > 0:
-                batch.commit()
+            # The scan and batch commits are blocking client calls; run them in a
+            # worker thread so several collections can be checked concurrently
+            import asyncio
+            checked_count, fixed_count = await asyncio.to_thread(self._fix_document_ids)
             
             self.log_operation("ensure_document_ids_consistency", 
                              collection=self.collection_name, 
@@ -504,6 +504,40 @@ class FirestoreRepository(EnhancedLoggerMixin):
                           collection=self.collection_name)
             raise
     
+    def _fix_document_ids(self) -> tuple:
+        """Synchronously align 'id' fields with document IDs; returns (checked, fixed)"""
+        docs = self.collection.stream()
+        checked_count = 0
+        fixed_count = 0
+        
+        batch = self.db.batch()
+        batch_operations = 0
+        now = datetime.now(timezone.utc)
+        
+        for doc in docs:
+            checked_count += 1
+            data = doc.to_dict()
+            
+            # Check if id field is missing or doesn't match document ID
+            if 'id' not in data or data['id'] != doc.id:
+                doc_ref = self.collection.document(doc.id)
+                batch.update(doc_ref, {'id': doc.id, 'updated_at': now})
+                
+                fixed_count += 1
+                batch_operations += 1
+                
+                # Commit batch every 500 operations (Firestore limit)
+                if batch_operations >= MAX_BATCH_OPERATIONS:
+                    batch.commit()
+                    batch = self.db.batch()
+                    batch_operations = 0
+        
+        # Commit remaining operations
+        if batch_operations > 0:
+            batch.commit()
+        
+        return checked_count, fixed_count
+    
     async def search_text(self, 
                          search_fields: List[str],
                          search_term: str,
@@ -8,6 +8,8 @@ Simplified FastAPI application for Google Cloud Run
 
 from fastapi import FastAPI
 
+from fastapi.responses import ORJSONResponse
+
 from fastapi.middleware.cors import CORSMiddleware
 
 from contextlib import asynccontextmanager
@@ -178,6 +180,8 @@ app = FastAPI(
 
   redirect_slashes=False, # Disable automatic slash redirection to prevent 307 redirects
 
+  default_response_class=ORJSONResponse, # orjson serializes large list/DTO responses much faster than stdlib json
+
 )
 
 
@@ -3,6 +3,7 @@ Optimized Authentication Service
 Consolidated authentication, user management, and workspace operations
 """
 from typing import Optional, Dict, Any, List
+import asyncio
 from datetime import timedelta, datetime
 from fastapi import HTTPException, status
 from functools import lru_cache
@@ -124,7 +125,7 @@ class AuthService:
                 "first_name": user_data.first_name,
                 "last_name": user_data.last_name,
                 "role_id": role_id,
-                "hashed_password": get_password_hash(user_data.password),
+                "hashed_password": await asyncio.to_thread(get_password_hash, user_data.password),
                 "is_active": True,
                 "is_verified": False,
                 "email_verified": False,
@@ -159,7 +160,7 @@ class AuthService:
             if not user or not user.get("is_active", True):
                 return None
             
-            if not verify_password(password, user["hashed_password"]):
+            if not await asyncio.to_thread(verify_password, password, user["hashed_password"]):
                 return None
             
             # Remove password from user data
@@ -281,11 +282,12 @@ class AuthService:
             if not user:
                 raise HTTPException(status_code=404, detail="User not found")
             
-            if not verify_password(current_password, user["hashed_password"]):
+            if not await asyncio.to_thread(verify_password, current_password, user["hashed_password"]):
                 raise HTTPException(status_code=400, detail="Incorrect current password")
             
             # Update password
-            new_hashed_password = get_password_hash(new_password)
+            # bcrypt is deliberately CPU-heavy; hash off the event loop
+            new_hashed_password = await asyncio.to_thread(get_password_hash, new_password)
             await user_repo.update(user_id, {"hashed_password": new_hashed_password})
             
             return True
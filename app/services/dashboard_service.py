@@ -5,6 +5,7 @@ Handles complex dashboard data aggregation and analytics
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta, timezone
 from collections import defaultdict
+import heapq
 from fastapi import HTTPException, status
 
 from app.core.logging_config import get_logger
@@ -31,15 +32,18 @@ class DashboardService:
         """Get comprehensive dashboard data for super admin"""
         try:
             # Get repositories
-            workspace_repo = self._get_repo_manager().get_repository('workspace')
-            venue_repo = self._get_repo_manager().get_repository('venue')
-            user_repo = self._get_repo_manager().get_repository('user')
-            order_repo = self._get_repo_manager().get_repository('order')
-            table_repo = self._get_repo_manager().get_repository('table')
-            menu_item_repo = self._get_repo_manager().get_repository('menu_item')
+            rm = self._get_repo_manager()
+            workspace_repo = rm.get_repository('workspace')
+            venue_repo = rm.get_repository('venue')
+            user_repo = rm.get_repository('user')
+            order_repo = rm.get_repository('order')
+            table_repo = rm.get_repository('table')
+            menu_item_repo = rm.get_repository('menu_item')
             
             # Get today's date range (timezone-aware)
-            today = datetime.utcnow().date()
+            now = datetime.utcnow()
+            now_iso = now.isoformat()
+            today = now.date()
             today_start = datetime.combine(today, datetime.min.time()).replace(tzinfo=timezone.utc)
             today_end = datetime.combine(today, datetime.max.time()).replace(tzinfo=timezone.utc)
             
@@ -140,7 +144,7 @@ class DashboardService:
                     return created_at.replace(tzinfo=timezone.utc)
                 return created_at
             
-            recent_orders = sorted(orders, key=get_order_date, reverse=True)[:20]
+            recent_orders = heapq.nlargest(20, orders, key=get_order_date)
             
             # Format recent orders with venue and table info
             formatted_recent_orders = []
@@ -161,10 +165,10 @@ class DashboardService:
                     'order_number': order.get('order_number', 'N/A'),
                     'venue_name': venue_name,
                     'table_number': table_number,
-                    'total_amount': order.get('total_amount', 0),
+                    'total_amount': float(order.get('total_amount') or 0),
                     'status': order.get('status', 'unknown'),
                     'payment_status': order.get('payment_status', 'unknown'),
-                    'created_at': order.get('created_at', datetime.utcnow()).isoformat() if order.get('created_at') else datetime.utcnow().isoformat(),
+                    'created_at': order['created_at'].isoformat() if order.get('created_at') else now_iso,
                 })
             
             # Calculate venue performance
@@ -191,15 +195,31 @@ class DashboardService:
                     'status': venue.get('status', 'unknown')
                 })
             
+            # Group entities by workspace once instead of rescanning per workspace
+            venues_by_workspace = defaultdict(list)
+            for venue in venues:
+                venues_by_workspace[venue.get('workspace_id')].append(venue)
+            
+            users_by_workspace = defaultdict(list)
+            for user in users:
+                users_by_workspace[user.get('workspace_id')].append(user)
+            
+            venue_workspace_ids = {v['id']: v.get('workspace_id') for v in venues}
+            orders_by_workspace = defaultdict(list)
+            for order in orders:
+                venue_id = order.get('venue_id')
+                if venue_id in venue_workspace_ids:
+                    orders_by_workspace[venue_workspace_ids[venue_id]].append(order)
+            
             # Prepare workspace details with enhanced data
             workspace_details = []
             for workspace in workspaces:
                 workspace_id = workspace['id']
                 
                 # Count entities in this workspace
-                workspace_venues = [v for v in venues if v.get('workspace_id') == workspace_id]
-                workspace_users = [u for u in users if u.get('workspace_id') == workspace_id]
-                workspace_orders = [o for o in orders if any(v['id'] == o.get('venue_id') for v in workspace_venues)]
+                workspace_venues = venues_by_workspace.get(workspace_id, [])
+                workspace_users = users_by_workspace.get(workspace_id, [])
+                workspace_orders = orders_by_workspace.get(workspace_id, [])
                 workspace_revenue = sum(order.get('total_amount', 0) for order in workspace_orders if order.get('payment_status') == PaymentStatus.PAID.value)
                 
                 workspace_details.append({
@@ -210,7 +230,7 @@ class DashboardService:
                     "total_orders": len(workspace_orders),
                     "total_revenue": workspace_revenue,
                     "is_active": workspace.get('is_active', False),
-                    "created_at": workspace.get('created_at', datetime.utcnow()).isoformat() if workspace.get('created_at') else datetime.utcnow().isoformat(),
+                    "created_at": workspace['created_at'].isoformat() if workspace.get('created_at') else now_iso,
                 })
             
             return {
@@ -250,13 +270,16 @@ class DashboardService:
         """Get dashboard data for venue admin"""
         try:
             # Get repositories
-            order_repo = self._get_repo_manager().get_repository('order')
-            table_repo = self._get_repo_manager().get_repository('table')
-            menu_item_repo = self._get_repo_manager().get_repository('menu_item')
-            user_repo = self._get_repo_manager().get_repository('user')
+            rm = self._get_repo_manager()
+            order_repo = rm.get_repository('order')
+            table_repo = rm.get_repository('table')
+            menu_item_repo = rm.get_repository('menu_item')
+            user_repo = rm.get_repository('user')
             
             # Get today's date range (timezone-aware)
-            today = datetime.utcnow().date()
+            now = datetime.utcnow()
+            now_iso = now.isoformat()
+            today = now.date()
             today_start = datetime.combine(today, datetime.min.time()).replace(tzinfo=timezone.utc)
             today_end = datetime.combine(today, datetime.max.time()).replace(tzinfo=timezone.utc)
             
@@ -306,11 +329,7 @@ class DashboardService:
                     return created_at.replace(tzinfo=timezone.utc)
                 return created_at
             
-            recent_orders = sorted(
-                all_orders,
-                key=get_order_date,
-                reverse=True
-            )[:10]
+            recent_orders = heapq.nlargest(10, all_orders, key=get_order_date)
             
             # Format recent orders
             formatted_recent_orders = []
@@ -326,9 +345,9 @@ class DashboardService:
                     "id": order['id'],
                     "order_number": order.get('order_number', 'N/A'),
                     "table_number": table_number,
-                    "total_amount": order.get('total_amount', 0),
+                    "total_amount": float(order.get('total_amount') or 0),
                     "status": order.get('status', 'unknown'),
-                    "created_at": order.get('created_at', datetime.utcnow()).isoformat() if order.get('created_at') else datetime.utcnow().isoformat(),
+                    "created_at": order['created_at'].isoformat() if order.get('created_at') else now_iso,
                 })
             
             return {
@@ -352,8 +371,10 @@ class DashboardService:
         """Get dashboard data for venue operator"""
         try:
             # Get repositories
-            order_repo = self._get_repo_manager().get_repository('order')
-            table_repo = self._get_repo_manager().get_repository('table')
+            rm = self._get_repo_manager()
+            order_repo = rm.get_repository('order')
+            table_repo = rm.get_repository('table')
+            now_iso = datetime.utcnow().isoformat()
             
             # Get all orders for this venue
             all_orders = await order_repo.get_by_venue(venue_id)
@@ -405,9 +426,9 @@ class DashboardService:
                     "id": order['id'],
                     "order_number": order.get('order_number', 'N/A'),
                     "table_number": table_number,
-                    "total_amount": order.get('total_amount', 0),
+                    "total_amount": float(order.get('total_amount') or 0),
                     "status": order.get('status', 'unknown'),
-                    "created_at": order.get('created_at', datetime.utcnow()).isoformat() if order.get('created_at') else datetime.utcnow().isoformat(),
+                    "created_at": order['created_at'].isoformat() if order.get('created_at') else now_iso,
                     "estimated_ready_time": estimated_ready_time.isoformat() if estimated_ready_time else None,
                     "items_count": len(order.get('items', [])),
                 })
@@ -431,8 +452,10 @@ class DashboardService:
     async def get_live_order_status(self, venue_id: str) -> Dict[str, Any]:
         """Get real-time order status for venue"""
         try:
-            order_repo = self._get_repo_manager().get_repository('order')
-            table_repo = self._get_repo_manager().get_repository('table')
+            rm = self._get_repo_manager()
+            order_repo = rm.get_repository('order')
+            table_repo = rm.get_repository('table')
+            now_iso = datetime.utcnow().isoformat()
             
             # Get all orders for this venue
             all_orders = await order_repo.get_by_venue(venue_id)
@@ -468,9 +491,9 @@ class DashboardService:
                     "id": order['id'],
                     "order_number": order.get('order_number', 'N/A'),
                     "table_number": table_number,
-                    "total_amount": order.get('total_amount', 0),
+                    "total_amount": float(order.get('total_amount') or 0),
                     "status": status,
-                    "created_at": order.get('created_at', datetime.utcnow()).isoformat() if order.get('created_at') else datetime.utcnow().isoformat(),
+                    "created_at": order['created_at'].isoformat() if order.get('created_at') else now_iso,
                 }
                 
                 orders_by_status[status].append(order_data)
@@ -501,7 +524,6 @@ class DashboardService:
             
             # Get all tables for this venue
             tables = await table_repo.get_by_venue(venue_id)
-            active_tables = [t for t in tables if t.get('is_active', False)]
             
             # Count by status
             status_counts = {
@@ -511,8 +533,13 @@ class DashboardService:
                 "maintenance": 0,
             }
             
+            # Filter, count and format active tables in a single pass
+            total_tables = 0
             formatted_tables = []
-            for table in active_tables:
+            for table in tables:
+                if not table.get('is_active', False):
+                    continue
+                total_tables += 1
                 status = table.get('table_status', TableStatus.AVAILABLE.value)
                 
                 # Count status
@@ -529,7 +556,7 @@ class DashboardService:
             return {
                 "tables": formatted_tables,
                 "summary": {
-                    "total_tables": len(active_tables),
+                    "total_tables": total_tables,
                     "available": status_counts["available"],
                     "occupied": status_counts["occupied"],
                     "reserved": status_counts["reserved"],
@@ -545,12 +572,13 @@ class DashboardService:
         """Get dashboard data for a specific venue with frontend-expected structure"""
         try:
             # Get repositories
-            venue_repo = self._get_repo_manager().get_repository('venue')
-            order_repo = self._get_repo_manager().get_repository('order')
-            table_repo = self._get_repo_manager().get_repository('table')
-            menu_item_repo = self._get_repo_manager().get_repository('menu_item')
-            menu_category_repo = self._get_repo_manager().get_repository('menu_category')
-            user_repo = self._get_repo_manager().get_repository('user')
+            rm = self._get_repo_manager()
+            venue_repo = rm.get_repository('venue')
+            order_repo = rm.get_repository('order')
+            table_repo = rm.get_repository('table')
+            menu_item_repo = rm.get_repository('menu_item')
+            menu_category_repo = rm.get_repository('menu_category')
+            user_repo = rm.get_repository('user')
             
             # Validate venue exists
             venue = await venue_repo.get_by_id(venue_id)
@@ -561,7 +589,9 @@ class DashboardService:
                 )
             
             # Get today's date range (timezone-aware)
-            today = datetime.utcnow().date()
+            now = datetime.utcnow()
+            now_iso = now.isoformat()
+            today = now.date()
             today_start = datetime.combine(today, datetime.min.time()).replace(tzinfo=timezone.utc)
             today_end = datetime.combine(today, datetime.max.time()).replace(tzinfo=timezone.utc)
             
@@ -613,11 +643,7 @@ class DashboardService:
                     return created_at.replace(tzinfo=timezone.utc)
                 return created_at
             
-            recent_orders = sorted(
-                all_orders,
-                key=get_order_date,
-                reverse=True
-            )[:10]
+            recent_orders = heapq.nlargest(10, all_orders, key=get_order_date)
             
             # Format recent orders with actual data
             formatted_recent_orders = []
@@ -633,10 +659,10 @@ class DashboardService:
                     "id": order['id'],
                     "order_number": order.get('order_number', 'N/A'),
                     "table_number": table_number,
-                    "total_amount": order.get('total_amount', 0),
+                    "total_amount": float(order.get('total_amount') or 0),
                     "status": order.get('status', 'unknown'),
                     "payment_status": order.get('payment_status', 'unknown'),
-                    "created_at": order.get('created_at', datetime.utcnow()).isoformat() if order.get('created_at') else datetime.utcnow().isoformat(),
+                    "created_at": order['created_at'].isoformat() if order.get('created_at') else now_iso,
                 })
             
             # Calculate order status breakdown with colors
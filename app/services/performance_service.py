@@ -30,7 +30,7 @@ class PerformanceService:
         """Cache query result with TTL"""
         self._query_cache[cache_key] = result
         self._cache_ttl[cache_key] = datetime.utcnow() + timedelta(minutes=ttl_minutes)
-        logger.debug(f"Cached query result: {cache_key}")
+        logger.debug("Cached query result: %s", cache_key)
     
     def get_cached_result(self, cache_key: str) -> Optional[Any]:
         """Get cached result if valid"""
@@ -43,7 +43,7 @@ class PerformanceService:
             self._cache_ttl.pop(cache_key, None)
             return None
         
-        logger.debug(f"Cache hit: {cache_key}")
+        logger.debug("Cache hit: %s", cache_key)
         return self._query_cache[cache_key]
     
     def clear_cache(self, pattern: Optional[str] = None) -> None:
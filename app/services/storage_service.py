@@ -5,6 +5,7 @@ Provides a clean interface for file storage operations with multiple backend sup
 from typing import Optional, List, Dict, Any
 from abc import ABC, abstractmethod
 from fastapi import UploadFile
+import asyncio
 import os
 from datetime import datetime
 
@@ -68,14 +69,11 @@ class LocalStorageBackend(StorageBackend):
     async def upload_file(self, file: UploadFile, path: str) -> str:
         """Upload file to local storage"""
         try:
-            # Create directory structure
             full_path = os.path.join(self.upload_dir, path)
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            content = await file.read()
             
-            # Save file
-            with open(full_path, "wb") as buffer:
-                content = await file.read()
-                buffer.write(content)
+            # Write off the event loop so other requests are not blocked
+            await asyncio.to_thread(self._write_file, full_path, content)
             
             # Return public URL
             public_url = f"{self.base_url}/{path}"
@@ -90,11 +88,10 @@ class LocalStorageBackend(StorageBackend):
         """Delete file from local storage"""
         try:
             full_path = os.path.join(self.upload_dir, path)
-            if os.path.exists(full_path):
-                os.remove(full_path)
+            deleted = await asyncio.to_thread(self._remove_file, full_path)
+            if deleted:
                 logger.info(f"Local delete: {path}")
-                return True
-            return False
+            return deleted
         except Exception as e:
             logger.error(f"Local delete failed: {e}")
             return False
@@ -102,6 +99,21 @@ class LocalStorageBackend(StorageBackend):
     async def get_file_url(self, path: str) -> str:
         """Get local file URL"""
         return f"{self.base_url}/{path}"
+    
+    @staticmethod
+    def _write_file(full_path: str, content: bytes) -> None:
+        """Create parent directories and write file contents (blocking)"""
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "wb") as buffer:
+            buffer.write(content)
+    
+    @staticmethod
+    def _remove_file(full_path: str) -> bool:
+        """Remove a file if it exists (blocking)"""
+        if os.path.exists(full_path):
+            os.remove(full_path)
+            return True
+        return False
 
 
 class CloudStorageBackend(StorageBackend):
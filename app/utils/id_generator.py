@@ -2,13 +2,57 @@
 Firestore ID Generator Utility
 Provides centralized ID generation using Firestore's native format
 """
-from typing import Optional
+from typing import List, Optional
+from collections import deque
+import asyncio
+from functools import partial
+import secrets
+import string
+import threading
 from google.cloud import firestore
 from app.core.config import get_firestore_client
 from app.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Number of IDs allocated per pool refill
+ID_POOL_BLOCK_SIZE = 1024
+# Pool size below which async callers trigger a background refill
+ID_POOL_LOW_WATERMARK = 128
+
+# Firestore auto-IDs: 20 characters drawn uniformly from [A-Za-z0-9]
+_ID_ALPHABET = string.ascii_letters + string.digits
+_ID_LENGTH = 20
+_ID_ALPHABET_BYTES = _ID_ALPHABET.encode('ascii')
+# Largest multiple of 62 that fits in a byte; higher bytes are rejected to avoid modulo bias
+_UNBIASED_BYTE_LIMIT = 256 - (256 % len(_ID_ALPHABET))
+
+
+# Legacy UUID format: 8-4-4-4-12 hex characters separated by hyphens
+_UUID_LENGTH = 36
+_UUID_HYPHEN_POSITIONS = (8, 13, 18, 23)
+_HEX_BYTES = b'0123456789abcdefABCDEF'
+
+
+def _random_alphanumeric(length: int) -> str:
+    """Build a uniformly random [A-Za-z0-9] string from batched random bytes"""
+    alphabet = _ID_ALPHABET
+    base = len(alphabet)
+    limit = _UNBIASED_BYTE_LIMIT
+    chars: List[str] = []
+    while len(chars) < length:
+        # Over-draw slightly so rejected bytes rarely force a second round
+        raw = secrets.token_bytes(length - len(chars) + 32)
+        chars.extend(alphabet[b % base] for b in raw if b < limit)
+    return ''.join(chars[:length])
+
+
+def _generate_local_ids(count: int) -> List[str]:
+    """Generate Firestore-style IDs locally from a single batch of random bytes"""
+    needed = count * _ID_LENGTH
+    joined = _random_alphanumeric(needed)
+    return [joined[i:i + _ID_LENGTH] for i in range(0, needed, _ID_LENGTH)]
+
 
 class FirestoreIDGenerator:
     """
@@ -16,101 +60,110 @@ class FirestoreIDGenerator:
     Generates IDs in the format: SOWLTGf5VydgACM4pJUq (20 characters, alphanumeric)
     """
     
+    __slots__ = ('_db', '_db_lock', '_id_pool', '_pool_lock', '_refill_task')
+    
     def __init__(self):
         self._db = None
+        self._db_lock = threading.Lock()
+        self._id_pool = deque()
+        self._pool_lock = threading.Lock()
+        self._refill_task: Optional[asyncio.Task] = None
     
     def _get_db(self):
         """Get Firestore client instance"""
-        if not self._db:
-            self._db = get_firestore_client()
-        return self._db
+        db = self._db
+        if db is None:
+            # Double-checked so concurrent first callers share one client
+            with self._db_lock:
+                db = self._db
+                if db is None:
+                    db = self._db = get_firestore_client()
+        return db
     
-    def generate_id(self, collection_name: Optional[str] = None) -> str:
+    def _refill(self, block: int = ID_POOL_BLOCK_SIZE) -> None:
+        """Pre-allocate a block of IDs into the pool. Caller must hold the pool lock."""
+        self._id_pool.extend(_generate_local_ids(block))
+    
+    def _refill_if_low(self) -> None:
+        """Top up the pool if it has dropped below the low watermark"""
+        with self._pool_lock:
+            if len(self._id_pool) < ID_POOL_LOW_WATERMARK:
+                self._refill()
+    
+    def generate_id(self, collection_name: Optional[str] = None, use_firestore: bool = False) -> str:
         """
         Generate a Firestore-style document ID.
         
+        IDs are generated locally with the same alphabet and length Firestore uses
+        for auto-IDs, so no client or document reference is needed.
+        
         Args:
             collection_name: Optional collection name for context (not used in generation)
+            use_firestore: Ask the Firestore client for the ID instead of generating it locally
             
         Returns:
             str: Firestore-style ID (e.g., 'SOWLTGf5VydgACM4pJUq')
         """
-        try:
-            db = self._get_db()
+        if use_firestore:
             # Use a temporary collection to generate ID, then return just the ID
-            temp_collection = db.collection('_temp_id_generation')
-            doc_ref = temp_collection.document()
-            generated_id = doc_ref.id
-            
-            logger.debug(f"Generated Firestore ID: {generated_id}" + 
-                        (f" for collection: {collection_name}" if collection_name else ""))
-            
-            return generated_id
-            
-        except Exception as e:
-            logger.error(f"Failed to generate Firestore ID: {e}")
-            # Fallback to a simple alphanumeric ID if Firestore is unavailable
-            import secrets
-            import string
-            fallback_id = ''.join(secrets.choice(string.ascii_letters + string.digits) for _ in range(20))
-            logger.warning(f"Using fallback ID generation: {fallback_id}")
-            return fallback_id
-    
-    def generate_workspace_id(self) -> str:
-        """Generate ID for workspace"""
-        return self.generate_id('workspaces')
-    
-    def generate_venue_id(self) -> str:
-        """Generate ID for venue"""
-        return self.generate_id('venues')
-    
-    def generate_user_id(self) -> str:
-        """Generate ID for user"""
-        return self.generate_id('users')
-    
-    def generate_role_id(self) -> str:
-        """Generate ID for role"""
-        return self.generate_id('roles')
-    
-    def generate_permission_id(self) -> str:
-        """Generate ID for permission"""
-        return self.generate_id('permissions')
-    
-    def generate_menu_category_id(self) -> str:
-        """Generate ID for menu category"""
-        return self.generate_id('menu_categories')
-    
-    def generate_menu_item_id(self) -> str:
-        """Generate ID for menu item"""
-        return self.generate_id('menu_items')
-    
-    def generate_table_id(self) -> str:
-        """Generate ID for table"""
-        return self.generate_id('tables')
-    
-    def generate_table_area_id(self) -> str:
-        """Generate ID for table area"""
-        return self.generate_id('table_areas')
-    
-    def generate_order_id(self) -> str:
-        """Generate ID for order"""
-        return self.generate_id('orders')
-    
-    def generate_customer_id(self) -> str:
-        """Generate ID for customer"""
-        return self.generate_id('customers')
-    
-    def generate_transaction_id(self) -> str:
-        """Generate ID for transaction"""
-        return self.generate_id('transactions')
+            generated_id = self._get_db().collection('_temp_id_generation').document().id
+        else:
+            with self._pool_lock:
+                if not self._id_pool:
+                    self._refill()
+                generated_id = self._id_pool.popleft()
+        
+        logger.debug("Generated Firestore ID: %s (collection: %s)", generated_id, collection_name)
+        
+        return generated_id
     
-    def generate_notification_id(self) -> str:
-        """Generate ID for notification"""
-        return self.generate_id('notifications')
+    def generate_ids(self, count: int, collection_name: Optional[str] = None) -> List[str]:
+        """
+        Generate several Firestore-style document IDs at once.
+        
+        Args:
+            count: Number of IDs to generate
+            collection_name: Optional collection name for context (not used in generation)
+            
+        Returns:
+            List[str]: Firestore-style IDs
+        """
+        with self._pool_lock:
+            if len(self._id_pool) < count:
+                self._refill(max(ID_POOL_BLOCK_SIZE, count - len(self._id_pool)))
+            pool = self._id_pool
+            ids = [pool.popleft() for _ in range(count)]
+        
+        logger.debug("Generated %d Firestore IDs (collection: %s)", count, collection_name)
+        
+        return ids
     
-    def generate_review_id(self) -> str:
-        """Generate ID for review"""
-        return self.generate_id('reviews')
+    async def generate_ids_async(self, count: int, collection_name: Optional[str] = None) -> List[str]:
+        """
+        Generate several Firestore-style document IDs without blocking the event loop.
+        
+        Requests the pool can already satisfy are served inline; larger ones are
+        generated in a worker thread. When the pool runs low a background refill
+        is scheduled so later callers find IDs ready.
+        
+        Args:
+            count: Number of IDs to generate
+            collection_name: Optional collection name for context (not used in generation)
+            
+        Returns:
+            List[str]: Firestore-style IDs
+        """
+        if len(self._id_pool) >= count:
+            ids = self.generate_ids(count, collection_name)
+        else:
+            ids = await asyncio.to_thread(self.generate_ids, count, collection_name)
+        
+        if len(self._id_pool) < ID_POOL_LOW_WATERMARK and (
+            self._refill_task is None or self._refill_task.done()
+        ):
+            self._refill_task = asyncio.create_task(asyncio.to_thread(self._refill_if_low))
+        
+        return ids
     
     def validate_firestore_id(self, doc_id: str) -> bool:
         """
@@ -126,12 +179,17 @@ class FirestoreIDGenerator:
             return False
         
         # Firestore auto-generated IDs are 20 characters long
-        # and contain only alphanumeric characters
-        if len(doc_id) != 20:
+        # and contain only ASCII alphanumeric characters
+        if len(doc_id) != _ID_LENGTH:
+            return False
+        
+        # isascii() reads a flag on the string object, so non-ASCII input is
+        # rejected without scanning or raising
+        if not doc_id.isascii():
             return False
         
-        # Check if all characters are alphanumeric
-        return doc_id.isalnum()
+        # Deleting every allowed byte must leave nothing behind
+        return not doc_id.encode('ascii').translate(None, _ID_ALPHABET_BYTES)
     
     def is_uuid_format(self, doc_id: str) -> bool:
         """
@@ -147,96 +205,79 @@ class FirestoreIDGenerator:
             return False
         
         # UUID format: 8-4-4-4-12 characters separated by hyphens
-        import re
-        uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-        return bool(re.match(uuid_pattern, doc_id, re.IGNORECASE))
+        if len(doc_id) != _UUID_LENGTH or not doc_id.isascii():
+            return False
+        
+        for position in _UUID_HYPHEN_POSITIONS:
+            if doc_id[position] != '-':
+                return False
+        
+        # Remaining 32 characters must all be hex digits
+        hex_part = doc_id.replace('-', '')
+        return len(hex_part) == 32 and not hex_part.encode('ascii').translate(None, _HEX_BYTES)
 
 
 # Global instance
 _id_generator = FirestoreIDGenerator()
 
 
-def generate_firestore_id(collection_name: Optional[str] = None) -> str:
+def generate_firestore_id(collection_name: Optional[str] = None, use_firestore: bool = False) -> str:
     """
     Generate a Firestore-style document ID.
     
     Args:
         collection_name: Optional collection name for context
+        use_firestore: Ask the Firestore client for the ID instead of generating it locally
         
     Returns:
         str: Firestore-style ID
     """
-    return _id_generator.generate_id(collection_name)
-
-
-def generate_workspace_id() -> str:
-    """Generate ID for workspace"""
-    return _id_generator.generate_workspace_id()
-
-
-def generate_venue_id() -> str:
-    """Generate ID for venue"""
-    return _id_generator.generate_venue_id()
-
-
-def generate_user_id() -> str:
-    """Generate ID for user"""
-    return _id_generator.generate_user_id()
-
-
-def generate_role_id() -> str:
-    """Generate ID for role"""
-    return _id_generator.generate_role_id()
-
-
-def generate_permission_id() -> str:
-    """Generate ID for permission"""
-    return _id_generator.generate_permission_id()
-
-
-def generate_menu_category_id() -> str:
-    """Generate ID for menu category"""
-    return _id_generator.generate_menu_category_id()
-
-
-def generate_menu_item_id() -> str:
-    """Generate ID for menu item"""
-    return _id_generator.generate_menu_item_id()
-
-
-def generate_table_id() -> str:
-    """Generate ID for table"""
-    return _id_generator.generate_table_id()
-
+    return _id_generator.generate_id(collection_name, use_firestore)
 
-def generate_table_area_id() -> str:
-    """Generate ID for table area"""
-    return _id_generator.generate_table_area_id()
 
-
-def generate_order_id() -> str:
-    """Generate ID for order"""
-    return _id_generator.generate_order_id()
-
-
-def generate_customer_id() -> str:
-    """Generate ID for customer"""
-    return _id_generator.generate_customer_id()
-
-
-def generate_transaction_id() -> str:
-    """Generate ID for transaction"""
-    return _id_generator.generate_transaction_id()
-
-
-def generate_notification_id() -> str:
-    """Generate ID for notification"""
-    return _id_generator.generate_notification_id()
+def generate_firestore_ids(count: int, collection_name: Optional[str] = None) -> List[str]:
+    """
+    Generate several Firestore-style document IDs in one call.
+    
+    Args:
+        count: Number of IDs to generate
+        collection_name: Optional collection name for context
+        
+    Returns:
+        List[str]: Firestore-style IDs
+    """
+    return _id_generator.generate_ids(count, collection_name)
 
 
-def generate_review_id() -> str:
-    """Generate ID for review"""
-    return _id_generator.generate_review_id()
+async def generate_firestore_ids_async(count: int, collection_name: Optional[str] = None) -> List[str]:
+    """
+    Generate several Firestore-style document IDs without blocking the event loop.
+    
+    Args:
+        count: Number of IDs to generate
+        collection_name: Optional collection name for context
+        
+    Returns:
+        List[str]: Firestore-style IDs
+    """
+    return await _id_generator.generate_ids_async(count, collection_name)
+
+
+# Per-collection generators, bound once at import time
+generate_workspace_id = partial(_id_generator.generate_id, 'workspaces')
+generate_venue_id = partial(_id_generator.generate_id, 'venues')
+generate_user_id = partial(_id_generator.generate_id, 'users')
+generate_role_id = partial(_id_generator.generate_id, 'roles')
+generate_permission_id = partial(_id_generator.generate_id, 'permissions')
+generate_menu_category_id = partial(_id_generator.generate_id, 'menu_categories')
+generate_menu_item_id = partial(_id_generator.generate_id, 'menu_items')
+generate_table_id = partial(_id_generator.generate_id, 'tables')
+generate_table_area_id = partial(_id_generator.generate_id, 'table_areas')
+generate_order_id = partial(_id_generator.generate_id, 'orders')
+generate_customer_id = partial(_id_generator.generate_id, 'customers')
+generate_transaction_id = partial(_id_generator.generate_id, 'transactions')
+generate_notification_id = partial(_id_generator.generate_id, 'notifications')
+generate_review_id = partial(_id_generator.generate_id, 'reviews')
 
 
 def validate_firestore_id(doc_id: str) -> bool:
@@ -263,10 +304,13 @@ def generate_short_id(length: int = 8) -> str:
     Generate a short unique ID.
     Note: This maintains the original behavior for specific use cases.
     """
-    import secrets
-    import string
-    return ''.join(secrets.choice(string.ascii_letters + string.digits) for _ in range(length))
+    return _random_alphanumeric(length)
 
 
 # Export the generator instance for advanced usage
-get_id_generator = lambda: _id_generator
\ No newline at end of file
+id_generator = _id_generator
+
+
+def get_id_generator() -> FirestoreIDGenerator:
+    """Get the global ID generator instance"""
+    return _id_generator
\ No newline at end of file
@@ -50,26 +50,33 @@ async def fix_all_collections():
     logger.info("🔧 Starting document ID consistency check across all collections...")
     logger.info("=" * 70)
     
-    for collection_name, repo in repositories:
-        logger.info(f"📋 Checking collection: {collection_name}")
+    # Open the shared channel and fetch credentials with one cheap read, so the
+    # concurrent scans below don't all queue behind the first handshake
+    await asyncio.to_thread(lambda: list(workspace_repo.collection.limit(1).stream()))
+    
+    # Collections are independent, so check them all concurrently
+    results = await asyncio.gather(
+        *(repo.ensure_document_ids_consistency() for _, repo in repositories),
+        return_exceptions=True
+    )
+    
+    for (collection_name, _), result in zip(repositories, results):
+        logger.info(f"📋 Checked collection: {collection_name}")
         
-        try:
-            result = await repo.ensure_document_ids_consistency()
-            
-            checked = result["checked"]
-            fixed = result["fixed"]
-            
-            total_checked += checked
-            total_fixed += fixed
-            
-            if fixed > 0:
-                logger.info(f"   ✅ Fixed {fixed} documents out of {checked} checked")
-            else:
-                logger.info(f"   ✓ All {checked} documents already consistent")
-                
-        except Exception as e:
-            logger.info(f"   ❌ Error processing {collection_name}: {e}")
+        if isinstance(result, Exception):
+            logger.info(f"   ❌ Error processing {collection_name}: {result}")
             continue
+        
+        checked = result["checked"]
+        fixed = result["fixed"]
+        
+        total_checked += checked
+        total_fixed += fixed
+        
+        if fixed > 0:
+            logger.info(f"   ✅ Fixed {fixed} documents out of {checked} checked")
+        else:
+            logger.info(f"   ✓ All {checked} documents already consistent")
     
     logger.info("=" * 70)
     logger.info(f"🎉 Completed! Total documents checked: {total_checked}")
@@ -4,11 +4,6 @@ Test script to send a WebSocket notification
 Run this to test if notifications are working
 """
 import asyncio
-import sys
-import os
-
-# Add the app directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 
 async def test_notification():
     """Test sending a WebSocket notification"""
@@ -36,21 +31,25 @@ async def test_notification():
         print(f"Sending test notification for venue: {test_order['venue_id']}")
         print(f"Order number: {test_order['order_number']}")
         
-        # Send notification
-        await connection_manager.send_order_notification(test_order, "order_created")
-        
-        print("✅ Test notification sent successfully!")
-        
-        # Also test system notification
-        await connection_manager.send_system_notification(
-            test_order['venue_id'],
-            "test_notification",
-            "Test Notification",
-            "This is a test notification to verify WebSocket functionality",
-            {"test": True}
+        # Send the order and system notifications concurrently; report each
+        # outcome separately so one failure doesn't hide the other
+        order_result, system_result = await asyncio.gather(
+            connection_manager.send_order_notification(test_order, "order_created"),
+            connection_manager.send_system_notification(
+                test_order['venue_id'],
+                "test_notification",
+                "Test Notification",
+                "This is a test notification to verify WebSocket functionality",
+                {"test": True}
+            ),
+            return_exceptions=True
         )
         
-        print("✅ Test system notification sent successfully!")
+        for label, result in (("notification", order_result), ("system notification", system_result)):
+            if isinstance(result, Exception):
+                print(f"❌ Error sending test {label}: {result}")
+            else:
+                print(f"✅ Test {label} sent successfully!")
         
     except Exception as e:
         print(f"❌ Error sending test notification: {e}")